@@ -15,8 +15,18 @@ v2.1 — Fixed:
 """
 
 import re
+import sys
+import logging
+import functools
 from datetime import datetime
 
+import ahocorasick              # pyahocorasick — C Aho-Corasick automaton
+import numpy as np
+
+from core.utils import fast_parse_date
+
+logger = logging.getLogger(__name__)
+
 # ═══════════════════════════════════════════════════════════
 #  PRE-COMPILED PATTERNS
 # ═══════════════════════════════════════════════════════════
@@ -38,8 +48,6 @@ _DATE_PATTERNS = [
      ['%Y-%m-%d', '%Y/%m/%d']),
 ]
 
-_RE_WHITESPACE = re.compile(r'\s+')
-
 _JUNK_PHRASES = [
     'rbi mandate', 'important information', 'account no.',
     'kotak mahindra bank', 'statement generated',
@@ -186,6 +194,44 @@ CATEGORY_MAP = {
 }
 
 
+MARKETPLACE_KEYWORDS = ['meesho', 'meeshofas', 'shiprocket', 'myntra des',
+                        'reliance r', 'ekart']
+
+# ═══════════════════════════════════════════════════════════
+#  KEYWORD → CATEGORY LOOKUP
+#  Every keyword stage of _categorize flattened into one list; position
+#  is priority (loan sources, family names, marketplace, then the
+#  category map in order), so the lowest-priority hit is what the old
+#  stage-by-stage scan would have returned.
+# ═══════════════════════════════════════════════════════════
+
+def _build_keyword_rules() -> list:
+    rules = (
+        [(kw, 'Loan Disbursal') for kw in LOAN_DISBURSAL_SOURCES] +
+        [(kw, 'Family Transfer') for kw in FAMILY_TRANSFER_NAMES] +
+        [(kw, 'Marketplace Income') for kw in MARKETPLACE_KEYWORDS] +
+        [(kw, cat) for cat, kws in CATEGORY_MAP.items() for kw in kws]
+    )
+    first = {}
+    for prio, (kw, cat) in enumerate(rules):
+        first.setdefault(kw, (prio, cat))
+    return sorted(first.items(), key=lambda item: item[1][0])
+
+
+_KEYWORD_RULES = _build_keyword_rules()   # [(kw, (priority, category))]
+
+_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _kw, _val in _KEYWORD_RULES:
+    _KEYWORD_AUTOMATON.add_word(_kw, _val)
+_KEYWORD_AUTOMATON.make_automaton()
+
+
+def _match_keyword_category(lower: str):
+    """Category of the highest-priority keyword found in lower, else None."""
+    best = min((val for _, val in _KEYWORD_AUTOMATON.iter(lower)), default=None)
+    return best[1] if best else None
+
+
 # ═══════════════════════════════════════════════════════════
 #  PUBLIC API
 # ═══════════════════════════════════════════════════════════
@@ -218,8 +264,20 @@ def normalize_date(date_str: str) -> str:
     """Convert any date string to YYYY-MM-DD. Returns original if unparseable."""
     if not date_str:
         return ''
+    return _normalize_date_cached(str(date_str).strip()) or date_str
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_date_cached(date_str: str):
+    # Returns None (not the input) when unparseable so the caller can
+    # hand back its original, unstripped value. Results are interned so that
+    # every spelling of the same day ('01/01/2024', '01 Jan 2024') shares one
+    # string object in the dedup keys and the output rows.
+    dt = fast_parse_date(date_str)
+    if dt is not None:
+        return sys.intern(dt.strftime('%Y-%m-%d'))
     for pattern, fmts in _DATE_PATTERNS:
-        m = pattern.search(str(date_str))
+        m = pattern.search(date_str)
         if not m:
             continue
         raw = m.group(1) if m.lastindex else m.group()
@@ -227,10 +285,10 @@ def normalize_date(date_str: str) -> str:
             try:
                 dt = datetime.strptime(raw.strip(), fmt)
                 if 2000 <= dt.year <= 2035:
-                    return dt.strftime('%Y-%m-%d')
+                    return sys.intern(dt.strftime('%Y-%m-%d'))
             except ValueError:
                 continue
-    return date_str
+    return None
 
 
 def categorize(desc: str) -> str:
@@ -243,48 +301,7 @@ def categorize(desc: str) -> str:
     4. Family transfer check
     5. Full category map scan
     """
-    lower = desc.lower()
-
-    # ── PCI/ card transactions ──────────────────────────────
-    if lower.startswith('pci/'):
-        for merchant, cat in PCI_MERCHANT_CATEGORY.items():
-            if merchant in lower:
-                return cat
-        return 'POS'  # generic card transaction
-
-    # ── MB: mobile banking ──────────────────────────────────
-    if lower.startswith('mb:'):
-        if 'salary' in lower:
-            return 'Salary'
-        if 'sent to' in lower:
-            return 'Family Transfer'
-        if 'received from' in lower:
-            return 'MB Transfer'
-        return 'Transfer'
-
-    # ── Loan disbursal sources ──────────────────────────────
-    for src in LOAN_DISBURSAL_SOURCES:
-        if src in lower:
-            return 'Loan Disbursal'
-
-    # ── Family transfer ─────────────────────────────────────
-    for name in FAMILY_TRANSFER_NAMES:
-        if name in lower:
-            return 'Family Transfer'
-
-    # ── Marketplace income check (before generic IMPS bucket) ──
-    marketplace_kws = ['meesho', 'meeshofas', 'shiprocket', 'myntra des',
-                       'reliance r', 'ekart']
-    if any(k in lower for k in marketplace_kws):
-        return 'Marketplace Income'
-
-    # ── Full category map ───────────────────────────────────
-    for cat, kws in CATEGORY_MAP.items():
-        for kw in kws:
-            if kw in lower:
-                return cat
-
-    return 'Other'
+    return _categorize(desc)
 
 
 def is_loan_disbursal(desc: str) -> bool:
@@ -317,6 +334,34 @@ def is_self_transfer(desc: str) -> bool:
 #  INTERNAL HELPERS
 # ═══════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=8192)
+def _categorize(desc: str) -> str:
+    """Body of categorize(), memoised: the same merchant descriptions
+    repeat across a statement."""
+    lower = desc.lower()
+
+    # ── PCI/ card transactions ──────────────────────────────
+    if lower.startswith('pci/'):
+        for merchant, cat in PCI_MERCHANT_CATEGORY.items():
+            if merchant in lower:
+                return cat
+        return 'POS'  # generic card transaction
+
+    # ── MB: mobile banking ──────────────────────────────────
+    if lower.startswith('mb:'):
+        if 'salary' in lower:
+            return 'Salary'
+        if 'sent to' in lower:
+            return 'Family Transfer'
+        if 'received from' in lower:
+            return 'MB Transfer'
+        return 'Transfer'
+
+    # ── Loan sources → family → marketplace → category map ──
+    #    (one pass; see _KEYWORD_RULES for the priority order)
+    return _match_keyword_category(lower) or 'Other'
+
+
 def _resolve_opening_balance(txns: list, opening_balance: float) -> float:
     first = txns[0]
     b0    = first.get('balance')
@@ -329,57 +374,103 @@ def _resolve_opening_balance(txns: list, opening_balance: float) -> float:
             if abs(b0 - amt0) <= max(1.0, amt0 * 0.01):
                 opening_balance = 0.0
                 first['type']   = 'CR'
-                print(f"[normalize] First txn looks like opening deposit → OB=0.00")
+                logger.debug("[normalize] First txn looks like opening deposit → OB=0.00")
             elif implied_cr >= 0:
                 opening_balance = implied_cr
                 first['type']   = 'CR'
-                print(f"[normalize] Inferred OB (CR path): ₹{opening_balance:,.2f}")
+                logger.debug("[normalize] Inferred OB (CR path): ₹%.2f", opening_balance)
             elif implied_dr >= 0:
                 opening_balance = implied_dr
                 first['type']   = 'DR'
-                print(f"[normalize] Inferred OB (DR path): ₹{opening_balance:,.2f}")
+                logger.debug("[normalize] Inferred OB (DR path): ₹%.2f", opening_balance)
     else:
         if b0 is not None and amt0 and not first.get('_type_locked'):
             diff = round(b0 - opening_balance, 2)
             tol  = max(1.0, round(amt0 * 0.01, 2))
             if abs(diff - amt0) <= tol:
                 first['type'] = 'CR'
-                print(f"[normalize] OB from PDF → first txn CR")
+                logger.debug("[normalize] OB from PDF → first txn CR")
             elif abs(diff + amt0) <= tol:
                 first['type'] = 'DR'
-                print(f"[normalize] OB from PDF → first txn DR")
+                logger.debug("[normalize] OB from PDF → first txn DR")
 
     return opening_balance
 
 
+# Only the balance-continuity pass is columnar. Dedup and categorize stay
+# per-row: priority-ordered substring matching and None-aware first-seen
+# keys don't map onto DataFrame ops without changing results, and the
+# per-row cost there is already behind caches.
+_VECTOR_MIN_ROWS = 256   # below this, array setup costs more than the loop
+
+
 def _fix_types(txns: list):
     """Fix CR/DR for all transactions using sequential balance diff."""
-    for i in range(1, len(txns)):
-        curr   = txns[i]
-        prev   = txns[i - 1]
-        b_curr = curr.get('balance')
-        b_prev = prev.get('balance')
-        amt    = curr.get('amount', 0)
-
-        if b_curr is not None and b_prev is not None and amt and not curr.get('_type_locked'):
-            diff = round(b_curr - b_prev, 2)
-            tol  = max(1.0, round(amt * 0.01, 2))
-            if abs(diff - amt) <= tol:
-                curr['type'] = 'CR'
-            elif abs(diff + amt) <= tol:
-                curr['type'] = 'DR'
+    if len(txns) < _VECTOR_MIN_ROWS:
+        for i in range(1, len(txns)):
+            _fix_type_at(txns, i)
+        return
+
+    bal = np.array([np.nan if t.get('balance') is None else t['balance'] for t in txns],
+                   dtype=np.float64)
+    amt = np.array([t.get('amount') or 0.0 for t in txns], dtype=np.float64)[1:]
+
+    diff   = np.round(bal[1:] - bal[:-1], 2)
+    tol    = np.maximum(1.0, np.round(amt * 0.01, 2))
+    err_cr = np.abs(diff - amt)
+    err_dr = np.abs(diff + amt)
+    valid  = (amt != 0) & ~np.isnan(diff)
+    is_cr  = valid & (err_cr <= tol)
+    is_dr  = valid & ~is_cr & (err_dr <= tol)
+    # np.round can land a cent away from round() on exact halves — rows
+    # within a cent of the tolerance are re-decided by the scalar path.
+    edge   = valid & ((np.abs(err_cr - tol) <= 0.011) | (np.abs(err_dr - tol) <= 0.011))
+
+    # Rows are independent (each reads balances, writes only its own type),
+    # so write back per mask over plain int indices — no per-row NumPy
+    # scalar indexing.
+    for j in np.flatnonzero(edge).tolist():
+        _fix_type_at(txns, j + 1)
+    for kind, mask in (('CR', is_cr & ~edge), ('DR', is_dr & ~edge)):
+        for j in np.flatnonzero(mask).tolist():
+            curr = txns[j + 1]
+            if not curr.get('_type_locked'):
+                curr['type'] = kind
+
+
+def _fix_type_at(txns: list, i: int):
+    curr   = txns[i]
+    prev   = txns[i - 1]
+    b_curr = curr.get('balance')
+    b_prev = prev.get('balance')
+    amt    = curr.get('amount', 0)
+
+    if b_curr is not None and b_prev is not None and amt and not curr.get('_type_locked'):
+        diff = round(b_curr - b_prev, 2)
+        tol  = max(1.0, round(amt * 0.01, 2))
+        if abs(diff - amt) <= tol:
+            curr['type'] = 'CR'
+        elif abs(diff + amt) <= tol:
+            curr['type'] = 'DR'
 
 
 def _dedup_and_clean(txns: list) -> list:
     """Deduplicate transactions and clean descriptions."""
     seen, result = set(), []
     for t in txns:
+        desc      = t.get('desc') or ''
         norm_date = normalize_date(t['date'])
+        # Full-row key on purpose: a (date, reference) pair is not unique —
+        # reversals and refunds reuse the original UTR, and most parsers
+        # leave 'reference' empty — and rows are not reliably date-sorted
+        # across pages, so a sliding window would miss repeated page rows.
+        # Kept a plain tuple: packing it into bytes costs more than the
+        # tuple hash it replaces, and would fold a None balance into 0.0.
         key = (
             norm_date,
             t['amount'],
             t['type'],
-            (t.get('desc') or '').strip(),
+            desc.strip(),
             t.get('balance'),
         )
         if key in seen:
@@ -389,11 +480,13 @@ def _dedup_and_clean(txns: list) -> list:
         t['date'] = norm_date or t['date']
 
         # Clean desc — strip junk phrases
-        raw_desc = _RE_WHITESPACE.sub(' ', t.get('desc') or '').strip()
+        raw_desc = ' '.join(desc.split())
+        raw_low  = raw_desc.lower()
         for junk in _JUNK_PHRASES:
-            ji = raw_desc.lower().find(junk)
+            ji = raw_low.find(junk)
             if ji > 10:
                 raw_desc = raw_desc[:ji].strip()
+                raw_low  = raw_desc.lower()
         t['desc']     = raw_desc[:200].strip()
         t['category'] = categorize(t['desc'])
 
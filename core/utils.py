@@ -6,6 +6,7 @@ Single source of truth for amount parsing, date detection, etc.
 """
 
 import re
+import functools
 import pdfplumber
 from datetime import datetime
 
@@ -22,9 +23,45 @@ _DATE_PATTERNS = [
      ['%Y-%m-%d', '%Y/%m/%d']),
 ]
 
+# Same seven shapes as _DATE_PATTERNS, fused into one alternation (branch
+# order = pattern priority) so a bare date string is classified and its
+# fields captured in a single fullmatch — no strptime format cascade.
+_RE_DATE_FUSED = re.compile(
+    r'(?P<dMonY>(?P<d0>\d{1,2})\s+(?P<b0>[A-Za-z]{3,9})\s+(?P<y0>\d{4}))'
+    r'|(?P<dMony>(?P<d1>\d{1,2})\s+(?P<b1>[A-Za-z]{3,9})\s+(?P<y1>\d{2}))'
+    r'|(?P<dMonYc>(?P<d2>\d{2})(?P<b2>[A-Za-z]{3})(?P<y2>\d{4}))'
+    r'|(?P<dMonyc>(?P<d3>\d{2})(?P<b3>[A-Za-z]{3})(?P<y3>\d{2}))'
+    r'|(?P<dmY>(?P<d4>\d{1,2})(?P<s4>[/\-.])(?P<m4>\d{1,2})(?P=s4)(?P<y4>\d{4}))'
+    r'|(?P<dmy>(?P<d5>\d{1,2})(?P<s5>[/\-.])(?P<m5>\d{1,2})(?P=s5)(?P<y5>\d{2}))'
+    r'|(?P<Ymd>(?P<y6>\d{4})(?P<s6>[/\-])(?P<m6>\d{1,2})(?P=s6)(?P<d6>\d{1,2}))',
+    re.ASCII,   # strptime only takes ASCII digits; others go to the full scan
+)
+
+_MONTH_ABBR = {
+    m: i + 1 for i, m in enumerate(
+        ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
+         'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])
+}
+_MONTH_FULL = {
+    m: i + 1 for i, m in enumerate(
+        ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+         'august', 'september', 'october', 'november', 'december'])
+}
+_MONTH_ANY = {**_MONTH_ABBR, **_MONTH_FULL}
+
+_RE_HAS_DIGIT   = re.compile(r'\d')
 _RE_PARENS_NUM  = re.compile(r'^\(([0-9.,]+)\)$')
-_RE_AMOUNT_JUNK = re.compile(r'[₹$€£,\s]')
-_RE_DR_CR_TAG   = re.compile(r'\s*(dr|cr|DR|CR|Dr|Cr)\.?\s*$')
+_DR_CR_TAGS     = ('dr', 'cr', 'DR', 'CR', 'Dr', 'Cr')
+
+# Currency symbols, thousands separators and every char `\s` matches —
+# deleted in one C-level str.translate pass instead of a regex sub.
+_AMOUNT_JUNK_CHARS = (
+    '₹$€£,'
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680'
+    '\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a'
+    '\u2028\u2029\u202f\u205f\u3000'
+)
+_AMOUNT_JUNK_TABLE = str.maketrans('', '', _AMOUNT_JUNK_CHARS)
 
 _RE_OB = re.compile(
     r'(?:opening\s+balance|open(?:ing)?\s+bal\.?|ob\s*:?|'
@@ -35,9 +72,18 @@ _RE_OB = re.compile(
 
 def try_date(text: str):
     """Return raw date string if parseable, else None."""
-    text = str(text).strip() if text else ''
+    return _try_date_cached(str(text).strip() if text else '')
+
+
+@functools.lru_cache(maxsize=8192)
+def _try_date_cached(text: str):
+    # Statements repeat the same date strings across many rows/cells
     if len(text) < 5 or len(text) > 80:
         return None
+    if not _RE_HAS_DIGIT.search(text):      # every date shape needs digits
+        return None
+    if fast_parse_date(text) is not None:   # cell is exactly one date
+        return text
     for pattern, fmts in _DATE_PATTERNS:
         m = pattern.search(text)
         if not m:
@@ -53,21 +99,95 @@ def try_date(text: str):
     return None
 
 
+def fast_parse_date(text: str):
+    """Parse a string that is exactly one date (already stripped) into a
+    datetime, using the fused pattern and int() fields instead of strptime.
+    Returns None when the text isn't a single recognised date or the date
+    is invalid / outside 2000–2035 — callers fall back to the full scan."""
+    m = _RE_DATE_FUSED.fullmatch(text)
+    if not m:
+        return None
+    g, kind = m.group, m.lastgroup
+    if kind in ('dMonY', 'dMony', 'dMonYc', 'dMonyc'):
+        i     = ('dMonY', 'dMony', 'dMonYc', 'dMonyc').index(kind)
+        names = _MONTH_ANY if i < 2 else _MONTH_ABBR
+        month = names.get(g(f'b{i}').lower())
+        if month is None:
+            return None
+        candidates = [(g(f'y{i}'), month, g(f'd{i}'))]
+    elif kind == 'dmY':
+        candidates = [(g('y4'), g('m4'), g('d4'))]
+        if g('s4') == '/':                  # %m/%d/%Y fallback
+            candidates.append((g('y4'), g('d4'), g('m4')))
+    elif kind == 'dmy':
+        candidates = [(g('y5'), g('m5'), g('d5'))]
+    else:
+        candidates = [(g('y6'), g('m6'), g('d6'))]
+
+    for y, mo, d in candidates:
+        year = int(y)
+        if len(y) == 2:                     # strptime %y pivot
+            year += 2000 if year < 69 else 1900
+        if not 2000 <= year <= 2035:
+            continue
+        try:
+            return datetime(year, int(mo), int(d))
+        except ValueError:
+            continue
+    return None
+
+
+# Besides digits, the only first chars float() accepts once junk is gone
+# (sign, decimal point, nan / inf). Anything else is text.
+_FLOAT_LEAD = frozenset('.+-nNiI')
+
+
+def to_float(s: str):
+    """float(s), or None if s isn't numeric. Text cells are rejected on
+    their first char, skipping the cost of a raised-and-caught ValueError."""
+    lead = s[:1]
+    if not lead or not (lead in _FLOAT_LEAD or lead.isdigit()):
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
+# Besides digits, every first char a string can have and still parse through
+# to_float(clean_amount_text(s)): a float lead, or junk that gets deleted.
+AMOUNT_LEAD_CHARS = _FLOAT_LEAD | frozenset(_AMOUNT_JUNK_CHARS)
+
+
+def clean_amount_text(s: str) -> str:
+    """Drop currency symbols, commas, whitespace and a trailing DR/CR tag."""
+    s = s.translate(_AMOUNT_JUNK_TABLE)
+    if s[-1:] in ('r', 'R', '.'):           # only then can a DR/CR tag remain
+        # whitespace is gone, so the tag is the last two chars before an
+        # optional '.' — slice it off instead of a regex sub
+        t = s[:-1] if s[-1] == '.' else s
+        if t[-2:] in _DR_CR_TAGS:
+            s = t[:-2]
+    return s
+
+
 def parse_amt(text: str) -> float:
     """Parse a string into a float amount. Always returns positive value."""
     if not text:
         return 0.0
-    s = str(text).strip()
-    m = _RE_PARENS_NUM.match(s)
-    if m:
-        s = m.group(1)
-    s = _RE_AMOUNT_JUNK.sub('', s)
-    s = _RE_DR_CR_TAG.sub('', s).strip()
-    s = s.replace('-', '').strip()
-    try:
-        return abs(float(s))
-    except (ValueError, TypeError):
-        return 0.0
+    return parse_amt_stripped(str(text).strip())
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_amt_stripped(s: str) -> float:
+    """parse_amt() for a caller that already holds the stripped str.
+    Cached: amount cells ('0.00', running balances) repeat heavily."""
+    if s.startswith('('):
+        m = _RE_PARENS_NUM.match(s)
+        if m:
+            s = m.group(1)
+    val = to_float(clean_amount_text(s).replace('-', ''))
+    return abs(val) if val is not None else 0.0
 
 
 _RE_STMT_PERIOD = re.compile(
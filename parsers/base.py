@@ -6,7 +6,7 @@ Abstract base class for all bank parsers.
 To add a new bank:
 1. Create parsers/newbank.py
 2. class NewBankParser(BaseParser)
-3. Implement detect() and parse()
+3. Implement detect_from_text(), detect() and parse()
 4. Register in parsers/detector.py
 """
 
@@ -16,6 +16,16 @@ class BaseParser:
     Every bank parser must inherit from this and implement both methods.
     """
 
+    def detect_from_text(self, text_low: str) -> bool:
+        """
+        Same decision as detect(), made on the already-extracted,
+        lower-cased first-page text. The detector reads page 1 once and
+        hands it to every parser, so this must not touch the PDF.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement detect_from_text()"
+        )
+
     def detect(self, pdf_path: str) -> bool:
         """
         Return True if this parser can handle the given PDF.
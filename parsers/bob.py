@@ -62,18 +62,20 @@ class BOBParser(BaseParser):
         'बैंक ऑफ़ बड़ौदा', 'बैंक ऑफ बड़ौदा'
     ]
 
+    def detect_from_text(self, text_low: str) -> bool:
+        has_ifsc = 'barb' in text_low
+
+        has_columns = all(h in text_low for h in [
+            'debit', 'credit', 'balance', 'description'
+        ])
+
+        return has_ifsc and has_columns
+
     def detect(self, pdf_path: str) -> bool:
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 text = (pdf.pages[0].extract_text() or '').lower()
-
-                has_ifsc = 'barb' in text
-
-                has_columns = all(h in text for h in [
-                    'debit', 'credit', 'balance', 'description'
-                ])
-
-                return has_ifsc and has_columns
+                return self.detect_from_text(text)
         except Exception:
             return False
 
@@ -10,7 +10,9 @@ import pdfplumber
 
 from parsers.base    import BaseParser
 from core.normalizer import normalize, normalize_date
-from core.utils      import parse_amt, extract_opening_balance_from_pdf
+from core.utils      import (
+    parse_amt, extract_opening_balance_from_pdf,
+)
 
 _RE_VALUE_DATE  = re.compile(r'\(?\s*[Vv]alue\s+[Dd]ate\s*:\s*[\d\-/\.]+\s*\)?')
 _RE_CHQ_SUFFIX  = re.compile(r'\s*Chq\s*[:.]?\s*[\dA-Za-z]*\s*$', re.IGNORECASE)
@@ -24,6 +26,12 @@ _SKIP_PHRASES = [
     'nominee', 'ifsc code', 'end of statement',
 ]
 
+_HEADER_PREFIXES = (
+    'statement for', 'branch code', 'customer id', 'branch name',
+    'phone', 'product code', 'product name', 'address',
+    'ifsc code', 'name ', 'a/c ', 'account no',
+)
+
 _ADDRESS_FRAGMENTS = [
     'ghaziabad', 'uttar pradesh', 'delhi', 'noida',
     'gurugram', 'faridabad', 'mumbai', 'bangalore',
@@ -58,26 +66,12 @@ class CanaraParser(BaseParser):
         pdf_opening_bal = extract_opening_balance_from_pdf(pdf_path)
 
         try:
+            # pdfplumber, not PDFium's get_text_range(): narration lines are
+            # attached to the next date line, so lines must come out in
+            # visual (top-to-bottom) order, not content-stream order.
             with pdfplumber.open(pdf_path) as pdf:
                 for page in pdf.pages:
-                    text          = page.extract_text() or ''
-                    lines         = [l.strip() for l in text.splitlines()]
-                    narration_buf = []
-
-                    for line in lines:
-                        if not line:
-                            continue
-                        if self._skip_line(line):
-                            continue
-                        txn = self._parse_txn_line(line)
-                        if txn:
-                            txn['desc'] = self._clean_desc(' '.join(narration_buf))
-                            narration_buf = []
-                            raw_txns.append(txn)
-                            continue
-                        if re.match(r'^Chq\s*:', line, re.IGNORECASE):
-                            continue
-                        narration_buf.append(line)
+                    raw_txns.extend(self._parse_page(page.extract_text() or ''))
 
         except Exception as e:
             import traceback
@@ -95,6 +89,27 @@ class CanaraParser(BaseParser):
 
     # ── Helpers ───────────────────────────────────────────
 
+    def _parse_page(self, text: str) -> list:
+        raw_txns      = []
+        lines         = [l.strip() for l in text.splitlines()]
+        narration_buf = []
+
+        for line in lines:
+            if not line:
+                continue
+            if self._skip_line(line):
+                continue
+            txn = self._parse_txn_line(line)
+            if txn:
+                txn['desc'] = self._clean_desc(' '.join(narration_buf))
+                narration_buf = []
+                raw_txns.append(txn)
+                continue
+            if re.match(r'^Chq\s*:', line, re.IGNORECASE):
+                continue
+            narration_buf.append(line)
+        return raw_txns
+
     def _skip_line(self, line: str) -> bool:
         lo = line.lower().strip()
         if re.match(r'^date\s+particulars\s+deposits\s+withdrawals\s+balance', lo):
@@ -103,11 +118,7 @@ class CanaraParser(BaseParser):
             return True
         if any(p in lo for p in _SKIP_PHRASES):
             return True
-        if any(lo.startswith(p) for p in [
-            'statement for', 'branch code', 'customer id', 'branch name',
-            'phone', 'product code', 'product name', 'address',
-            'ifsc code', 'name ', 'a/c ', 'account no',
-        ]):
+        if lo.startswith(_HEADER_PREFIXES):
             return True
         if any(frag in lo for frag in _ADDRESS_FRAGMENTS):
             return True
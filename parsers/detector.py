@@ -48,14 +48,15 @@ def detect(pdf_path: str):
     except Exception as e:
         raise RuntimeError(f"Cannot open PDF: {e}") from e
 
-    # Fast keyword-based pre-check before calling detect()
+    # Page 1 is extracted and lower-cased once, then shared by every parser
+    first_page_low = first_page_text.lower()
     for parser in _PARSERS:
         try:
-            if parser.detect(pdf_path):
+            if parser.detect_from_text(first_page_low):
                 print(f"[detector] Matched: {parser.__class__.__name__}")
                 return parser
         except Exception as ex:
-            print(f"[detector] {parser.__class__.__name__}.detect() failed: {ex}")
+            print(f"[detector] {parser.__class__.__name__}.detect_from_text() failed: {ex}")
             continue
 
     # Should never reach here because GenericParser.detect() always returns True
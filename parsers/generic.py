@@ -7,13 +7,16 @@ Used by Kotak and as fallback for unknown banks.
 """
 
 import re
+import functools
 import pdfplumber
 from collections import Counter
+from itertools   import groupby, zip_longest
 
 from parsers.base    import BaseParser
 from core.normalizer import normalize
 from core.utils      import (
-    parse_amt, try_date,
+    parse_amt, parse_amt_stripped, try_date, clean_amount_text, to_float,
+    AMOUNT_LEAD_CHARS,
     extract_opening_balance_from_pdf,
     extract_opening_balance_from_table,
 )
@@ -22,9 +25,14 @@ _RE_VALUE_DATE  = re.compile(r'\(?\s*[Vv]alue\s+[Dd]ate\s*:\s*[\d\-/\.]+\s*\)?')
 _RE_CHQ_SUFFIX  = re.compile(r'\s*Chq\s*[:.]?\s*[\dA-Za-z]*\s*$', re.IGNORECASE)
 _RE_WHITESPACE  = re.compile(r'\s+')
 _RE_MULTI_SPACE = re.compile(r'\s{2,}')
-_RE_PARENS_NUM  = re.compile(r'^\(([0-9.,]+)\)$')
-_RE_DR_CR_TAG   = re.compile(r'\s*(dr|cr|DR|CR|Dr|Cr)\.?\s*$')
-_RE_AMOUNT_JUNK = re.compile(r'[₹$€£,\s]')
+_RE_REF_LIKE    = re.compile(r'^[A-Za-z0-9]{2,12}[-/]?\d{5,}\Z')
+_RE_IDX         = re.compile(r'^[\d\-]+$')
+
+# Footer-row recovery from page text
+_RE_FOOTER_TXN   = re.compile(r'^(\d+)\s+(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})\s+(.+)$')
+_RE_FOOTER_START = re.compile(r'^\d+\s+\d{1,2}\s+[A-Za-z]{3}\s+\d{4}')
+_RE_FOOTER_AMT   = re.compile(r'[\d,]+\.\d{2}')
+_RE_PAGE_OF      = re.compile(r'page\s+\d+\s+of\s+\d+', re.I)
 
 _COL_KEYWORDS = {
     'date': [
@@ -74,10 +82,10 @@ _SKIP_PHRASES = [
     'nominee', 'ifsc code', 'end of statement',
 ]
 
-_TITLE_PHRASES = [
+_TITLE_PHRASES = {
     'savings account transactions', 'current account transactions',
     'account transactions', 'transaction details', 'statement of account',
-]
+}
 
 _HEADER_MARKER_CELLS = {
     'date', 'description', 'narration', 'particulars',
@@ -85,6 +93,62 @@ _HEADER_MARKER_CELLS = {
 }
 
 
+# Cell predicates below see the same strings over and over (repeated
+# headers, '0.00', the same date on every row of a day), so they are
+# memoised on the str form of the cell.
+
+@functools.lru_cache(maxsize=8192)
+def _norm_cached(text):
+    t = text.lower()
+    t = re.sub(r'[^a-z0-9 ./]', ' ', t)
+    return re.sub(r'\s+', ' ', t).strip()
+
+
+def _row_index_key(r):
+    return int(r[0]) if r and str(r[0]).strip().isdigit() else 0
+
+
+def _build_header_index():
+    # Exact-match lookup (first keyword wins) plus every (kw_norm, role)
+    # sorted longest-first; the sort is stable, so equal lengths keep
+    # _COL_KEYWORDS order — the same tie-break as scoring in order.
+    exact, by_len = {}, []
+    for role, keywords in _COL_KEYWORDS.items():
+        for kw in keywords:
+            kw_n = _norm_cached(kw)
+            exact.setdefault(kw_n, role)
+            by_len.append((kw_n, role))
+    by_len.sort(key=lambda e: -len(e[0]))
+    return exact, by_len
+
+
+_HDR_EXACT, _HDR_BY_LEN = _build_header_index()
+
+
+# First chars a numeric cell can start with before cleaning: digits (checked
+# separately), float() leads incl. nan/inf, and the junk clean_amount_text strips.
+@functools.lru_cache(maxsize=8192)
+def _is_num_cached(t):
+    if not t or not (t[0].isdigit() or t[0] in AMOUNT_LEAD_CHARS):
+        return False
+    return to_float(clean_amount_text(t)) is not None
+
+
+@functools.lru_cache(maxsize=8192)
+def _looks_like_ref_cached(t):
+    if len(t) < 6:
+        return False
+    if not t[-5:].isdigit():              # pattern ends in \d{5,}
+        return False
+    if ' ' in t:                          # _RE_REF_LIKE has no space in it,
+        return False                      # so e.g. 'UPI txn 123456' is out
+    # all-numeric ([\d,. ]+ with the space already ruled out) — two C-level
+    # replaces and isdecimal (which is exactly what \d matches) beat a regex
+    if t.replace(',', '').replace('.', '').isdecimal():
+        return False
+    return _RE_REF_LIKE.match(t) is not None
+
+
 class GenericParser(BaseParser):
 
     def detect_from_text(self, text_low: str) -> bool:
@@ -112,6 +176,7 @@ class GenericParser(BaseParser):
             return []
 
         raw = self._extract_rows(pages, col_map, hdr_row, hdr_page)
+        del pages   # cell lists aren't needed past this point — free before normalize
         self._log(f"Raw transactions: {len(raw)}")
 
         if not raw:
@@ -139,33 +204,39 @@ class GenericParser(BaseParser):
             except Exception:
                 page_text = ''
 
-            rows, strategy = self._extract_page(page, best_strategy)
-            if rows:
-                all_pages.append(rows)
-                if best_strategy is None and strategy:
-                    best_strategy = strategy
-
-                for row in rows:
-                    idx = str(row[0]).strip() if row and row[0] else ''
-                    if idx.isdigit():
-                        seen_indices.add(int(idx))
-
-                extra = self._recover_footer_rows(page_text, seen_indices)
-                if extra:
-                    all_pages[-1].extend(extra)
-                    all_pages[-1].sort(
-                        key=lambda r: int(r[0]) if r and str(r[0]).strip().isdigit() else 0
-                    )
+            rows, strategy = self._extract_page(page, best_strategy, page_text)
+            if rows and best_strategy is None and strategy:
+                best_strategy = strategy
+            self._add_page(all_pages, seen_indices, page_text, rows)
 
         pdf.close()
         return all_pages
 
-    def _extract_page(self, page, preferred=None):
+    def _add_page(self, all_pages, seen_indices, page_text, rows):
+        if not rows:
+            return
+        all_pages.append(rows)
+
+        for row in rows:
+            idx = str(row[0]).strip() if row and row[0] else ''
+            if idx.isdigit():
+                seen_indices.add(int(idx))
+
+        extra = self._recover_footer_rows(page_text, seen_indices)
+        if extra:
+            # Page rows and recovered rows each arrive (mostly) in index
+            # order, so Timsort's run detection makes this close to a linear
+            # merge; the key is computed once per row.
+            all_pages[-1].extend(extra)
+            all_pages[-1].sort(key=_row_index_key)
+
+    def _extract_page(self, page, preferred=None, page_text=None):
+        # page_text: the caller's page.extract_text(), reused by 'lines'
         strategies = [
             ('table',         self._try_table),
             ('table_relaxed', self._try_table_relaxed),
             ('words',         self._try_words),
-            ('lines',         self._try_lines),
+            ('lines',         lambda p: self._try_lines(p, page_text)),
         ]
         if preferred:
             for name, fn in strategies:
@@ -174,6 +245,8 @@ class GenericParser(BaseParser):
                     if rows and self._good_rows(rows) >= 1:
                         return rows, name
         for name, fn in strategies:
+            if name == preferred:       # already tried above, same result
+                continue
             rows = fn(page)
             if rows and self._good_rows(rows) >= 1:
                 return rows, name
@@ -205,15 +278,12 @@ class GenericParser(BaseParser):
             words = page.extract_words(x_tolerance=3, y_tolerance=3)
             if not words:
                 return []
-            lines = {}
-            for w in words:
-                y = round(w['top'] / 3) * 3
-                lines.setdefault(y, []).append(w)
+            # One sort on (y-bucket, x0), then group consecutive buckets
+            words.sort(key=lambda w: (round(w['top'] / 3), w['x0']))
             rows = []
-            for y in sorted(lines):
-                lw     = sorted(lines[y], key=lambda w: w['x0'])
+            for _, group in groupby(words, key=lambda w: round(w['top'] / 3)):
                 merged = []
-                for w in lw:
+                for w in group:
                     if merged and (w['x0'] - merged[-1]['x1']) < 15:
                         merged[-1]['text'] += ' ' + w['text']
                         merged[-1]['x1']    = w['x1']
@@ -226,9 +296,10 @@ class GenericParser(BaseParser):
         except Exception:
             return []
 
-    def _try_lines(self, page):
+    def _try_lines(self, page, text=None):
         try:
-            text = page.extract_text() or ''
+            if text is None:
+                text = page.extract_text() or ''
             rows = []
             for line in text.split('\n'):
                 line  = line.strip()
@@ -253,43 +324,42 @@ class GenericParser(BaseParser):
         return sum(1 for r in rows if sum(1 for c in r if str(c).strip()) >= 3)
 
     def _recover_footer_rows(self, text: str, seen_indices: set) -> list:
-        _RE_TXN = re.compile(r'^(\d+)\s+(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})\s+(.+)$')
-        _RE_AMT = re.compile(r'[\d,]+\.\d{2}')
         recovered, pending = [], None
 
         for line in text.splitlines():
             line = line.strip()
             if not line:
                 continue
-            if re.search(r'page\s+\d+\s+of\s+\d+', line, re.I):
+            if _RE_PAGE_OF.search(line):
                 continue
 
-            m = _RE_TXN.match(line)
+            m = _RE_FOOTER_TXN.match(line)
             if m:
                 idx = int(m.group(1))
                 if idx not in seen_indices:
                     if pending:
-                        recovered.append(self._build_row(pending, _RE_AMT))
+                        recovered.append(self._build_row(pending))
                     pending = {'idx': str(idx), 'date': m.group(2), 'rest': m.group(3)}
                 else:
                     if pending:
-                        recovered.append(self._build_row(pending, _RE_AMT))
+                        recovered.append(self._build_row(pending))
                         pending = None
             elif pending:
-                if not re.match(r'^\d+\s+\d{1,2}\s+[A-Za-z]{3}\s+\d{4}', line):
+                if not _RE_FOOTER_START.match(line):
                     pending['rest'] += ' ' + line
 
         if pending:
-            recovered.append(self._build_row(pending, _RE_AMT))
+            recovered.append(self._build_row(pending))
         return recovered
 
     @staticmethod
-    def _build_row(pending, re_amt):
+    def _build_row(pending):
         rest    = pending['rest'].strip()[:300]
-        amounts = re_amt.findall(rest)
+        matches = list(_RE_FOOTER_AMT.finditer(rest))
+        amounts = [m.group() for m in matches]
         balance = amounts[-1] if len(amounts) >= 1 else ''
         withdrawal = amounts[-2] if len(amounts) >= 2 else ''
-        first_pos = rest.find(amounts[0]) if amounts else len(rest)
+        first_pos = matches[0].start() if matches else len(rest)
         desc_part = rest[:first_pos].strip()
         return [pending['idx'], pending['date'], desc_part, '', withdrawal, '', balance]
 
@@ -300,15 +370,19 @@ class GenericParser(BaseParser):
     def _detect_columns(self, pages):
         for pg_idx, page in enumerate(pages):
             for row_idx, row in enumerate(page):
-                if self._is_title_row(row):
+                row_lower = self._prep_row(row)[1]
+                if self._is_title_row(row_lower) or not self._could_be_header(row_lower):
                     continue
                 cmap = self._match_header(row)
                 if cmap and self._valid_map(cmap):
                     return cmap, row_idx, pg_idx
 
         for pg_idx, page in enumerate(pages):
-            for row_idx in range(len(page) - 1):
-                merged = self._merge_rows(page[row_idx], page[row_idx + 1])
+            stripped = [[str(c).strip() for c in row] for row in page]
+            for row_idx in range(len(stripped) - 1):
+                merged = self._merge_stripped(stripped[row_idx], stripped[row_idx + 1])
+                if not self._could_be_header([c.lower() for c in merged]):
+                    continue
                 cmap   = self._match_header(merged)
                 if cmap and self._valid_map(cmap):
                     return cmap, row_idx + 1, pg_idx
@@ -316,20 +390,39 @@ class GenericParser(BaseParser):
         return self._infer_columns(pages)
 
     @staticmethod
-    def _is_title_row(row):
-        non_empty = [c.strip() for c in row if str(c).strip()]
-        return len(non_empty) == 1 and non_empty[0].lower() in _TITLE_PHRASES
+    def _prep_row(row):
+        """(stripped cells, lower-cased cells) for a row — computed once per
+        row and shared by the title / header-repeat / skip predicates, the
+        row parser and the cell classifier."""
+        cells = [str(c).strip() for c in row]
+        return cells, [s.lower() for s in cells]
+
+    @staticmethod
+    def _could_be_header(row_lower):
+        """Cheap reject before _match_header: a usable map needs a 'date'
+        column, and every 'date' keyword contains 'date' or 'dt'."""
+        for c in row_lower:
+            if 'date' in c or 'dt' in c:
+                return True
+        return False
 
     @staticmethod
-    def _is_header_row_repeat(row):
-        hits = sum(1 for cell in row if str(cell).strip().lower() in _HEADER_MARKER_CELLS)
-        return hits >= 3
+    def _is_title_row(row_lower):
+        only = None
+        for c in row_lower:
+            if c:
+                if only is not None:        # two non-empty cells: not a title
+                    return False
+                only = c
+        return only in _TITLE_PHRASES
+
+    @staticmethod
+    def _is_header_row_repeat(row_lower):
+        return sum(1 for c in row_lower if c in _HEADER_MARKER_CELLS) >= 3
 
     @staticmethod
     def _norm(text):
-        t = str(text).lower()
-        t = re.sub(r'[^a-z0-9 ./]', ' ', t)
-        return re.sub(r'\s+', ' ', t).strip()
+        return _norm_cached(str(text))
 
     def _match_header(self, row):
         if len(row) < 3:
@@ -345,16 +438,13 @@ class GenericParser(BaseParser):
                 cmap.setdefault('_index', idx)
                 continue
             norm = self._norm(raw)
-            best_role, best_score = None, 0
-            for role, keywords in _COL_KEYWORDS.items():
-                for kw in keywords:
-                    kw_n = self._norm(kw)
-                    if norm == kw_n:        score = 200
-                    elif norm.startswith(kw_n): score = 100 + len(kw_n)
-                    elif kw_n in norm:      score = 50 + len(kw_n)
-                    else:                   continue
-                    if score > best_score:
-                        best_score, best_role = score, role
+            # Exact match beats any prefix match, which beats any substring
+            # match; within a tier the longest keyword wins.
+            best_role = _HDR_EXACT.get(norm)
+            if best_role is None:
+                best_role = next((r for kw_n, r in _HDR_BY_LEN if norm.startswith(kw_n)), None)
+            if best_role is None:
+                best_role = next((r for kw_n, r in _HDR_BY_LEN if kw_n in norm), None)
             if best_role and best_role not in cmap:
                 cmap[best_role] = idx
         return cmap
@@ -364,13 +454,9 @@ class GenericParser(BaseParser):
         return 'date' in cmap and any(k in cmap for k in ('debit', 'credit', 'amount'))
 
     @staticmethod
-    def _merge_rows(a, b):
-        n = max(len(a), len(b))
-        return [
-            ((str(a[i]).strip() if i < len(a) else '') + ' ' +
-             (str(b[i]).strip() if i < len(b) else '')).strip()
-            for i in range(n)
-        ]
+    def _merge_stripped(a, b):
+        # a / b already stripped strings — one zip pass, no index arithmetic
+        return [(x + ' ' + y).strip() for x, y in zip_longest(a, b, fillvalue='')]
 
     def _infer_columns(self, pages):
         all_rows = [r for p in pages for r in p]
@@ -384,12 +470,20 @@ class GenericParser(BaseParser):
 
         cmap, num_cols = {}, []
         for ci in range(target):
-            vals  = [str(r[ci]) for r in sample]
             n     = len(sample)
-            dates = sum(1 for v in vals if try_date(v))
-            nums  = sum(1 for v in vals if self._is_num(v))
-            texts = sum(1 for v in vals if len(v.strip()) > 8 and not self._is_num(v) and not try_date(v))
-            idxs  = sum(1 for v in vals if re.match(r'^[\d\-]+$', v.strip()))
+            dates = nums = texts = idxs = 0
+            for r in sample:
+                v    = str(r[ci])
+                s    = v.strip()
+                is_d = try_date(v)
+                if is_d:
+                    dates += 1
+                if _is_num_cached(s):
+                    nums += 1
+                elif len(s) > 8 and not is_d:
+                    texts += 1
+                if _RE_IDX.match(s):
+                    idxs += 1
 
             if idxs / n > 0.6:      cmap.setdefault('_index', ci)
             elif dates / n > 0.4 and 'date' not in cmap: cmap['date'] = ci
@@ -416,155 +510,194 @@ class GenericParser(BaseParser):
     def _extract_rows(self, pages, col_map, hdr_row, hdr_page):
         txns    = []
         ignored = {col_map[k] for k in ('_index', 'reference') if k in col_map}
+        parse_row = self._make_row_parser(col_map, ignored)
 
         for pg_idx, page in enumerate(pages):
             start     = (hdr_row + 1) if pg_idx == hdr_page else 0
             data_rows = page[start:]
             for row in data_rows:
-                if self._is_title_row(row): continue
-                if self._is_header_row_repeat(row): continue
-                if self._should_skip_row(row): continue
-                txn = self._parse_row(row, col_map, ignored)
+                cells, row_lower = self._prep_row(row)
+                if self._is_title_row(row_lower): continue
+                if self._is_header_row_repeat(row_lower): continue
+                if self._should_skip_row(row_lower): continue
+                txn = parse_row(row, cells)
                 if txn:
                     txns.append(txn)
                 elif txns:
-                    cont = self._get_continuation(row, ignored)
+                    cont = self._get_continuation(row, ignored, cells)
                     if cont:
                         txns[-1]['desc'] = (txns[-1]['desc'] + ' ' + cont).strip()
         return txns
 
     @staticmethod
-    def _should_skip_row(row):
-        combined = ' '.join(str(c) for c in row).strip().lower()
+    def _should_skip_row(row_lower):
+        combined = ' '.join(row_lower).strip()
         if not combined:
             return True
-        return any(p in combined for p in _SKIP_PHRASES)
-
-    def _parse_row(self, row, col_map, ignored):
-        if len(row) < 2:
-            return None
-
-        date = None
-        if 'date' in col_map:
-            date = try_date(self._cell(row, col_map['date']))
-        if not date:
-            for ci, c in enumerate(row):
-                if ci not in ignored:
-                    date = try_date(str(c))
-                    if date:
-                        break
-        if not date:
-            return None
-
-        if '_index' in col_map:
-            if self._cell(row, col_map['_index']).strip() == '-':
-                return None
-
-        desc = ''
-        if 'description' in col_map:
-            desc = self._cell(row, col_map['description'])
-        if not desc.strip():
-            mapped = set(col_map.values()) | ignored
-            parts  = [str(c).strip() for ci, c in enumerate(row)
-                      if ci not in mapped and str(c).strip()
-                      and not self._is_num(str(c)) and not try_date(str(c))
-                      and not self._looks_like_ref(str(c))]
-            desc = ' '.join(parts)
-
-        desc = _RE_VALUE_DATE.sub('', desc)
-        desc = _RE_CHQ_SUFFIX.sub('', desc)
-        desc = _RE_WHITESPACE.sub(' ', desc).strip()[:200]
+        for p in _SKIP_PHRASES:
+            if p in combined:
+                return True
+        return False
 
-        reference = self._cell(row, col_map['reference']).strip() if 'reference' in col_map else ''
+    def _make_row_parser(self, col_map, ignored):
+        """Build the per-row parser for one statement. col_map is fixed once
+        columns are detected, so column indexes and the amount layout are
+        resolved here instead of re-checked against col_map on every row."""
+        cell   = self._cell
+        date_i = col_map.get('date')
+        idx_i  = col_map.get('_index')
+        desc_i = col_map.get('description')
+        ref_i  = col_map.get('reference')
+        bal_i  = col_map.get('balance')
+        mapped = set(col_map.values()) | ignored
 
         if 'debit' in col_map and 'credit' in col_map:
-            debit  = parse_amt(self._cell(row, col_map['debit']))
-            credit = parse_amt(self._cell(row, col_map['credit']))
+            deb_i, cred_i = col_map['debit'], col_map['credit']
+
+            def amounts(row, cells):
+                return parse_amt(cell(row, deb_i)), parse_amt(cell(row, cred_i))
         elif 'amount' in col_map:
-            debit, credit = self._parse_amt_directed(self._cell(row, col_map['amount']))
+            amt_i, directed = col_map['amount'], self._parse_amt_directed
+
+            def amounts(row, cells):
+                return directed(cell(row, amt_i))
         else:
-            debit, credit = self._find_amts(row, col_map, ignored)
+            find_amts  = self._find_amts
+            free_cols  = {}     # row width -> unmapped column indexes
+
+            def amounts(row, cells):
+                if cells is None:
+                    cells = [str(c).strip() for c in row]
+                cols = free_cols.get(len(cells))
+                if cols is None:
+                    cols = free_cols[len(cells)] = tuple(
+                        ci for ci in range(len(cells)) if ci not in mapped)
+                return find_amts(cells, cols)
+
+        def parse_row(row, cells=None):
+            if len(row) < 2:
+                return None
 
-        if debit == 0 and credit == 0:
-            return None
+            date = None
+            if date_i is not None:
+                date = try_date(cell(row, date_i))
+            if not date:
+                for ci, c in enumerate(row):
+                    if ci not in ignored:
+                        date = try_date(str(c))
+                        if date:
+                            break
+            if not date:
+                return None
+
+            if idx_i is not None and cell(row, idx_i) == '-':
+                return None
 
-        balance = None
-        if 'balance' in col_map:
-            b = parse_amt(self._cell(row, col_map['balance']))
-            if b > 0:
-                balance = b
+            desc = cell(row, desc_i) if desc_i is not None else ''
+            if not desc:
+                cells, tags = self._classify_row(row, cells)
+                desc = ' '.join(cells[ci] for ci in range(len(row))
+                                if ci not in mapped and tags[ci] == 'text')
 
-        if debit > 0:
-            typ, amount = 'DR', debit
-        else:
-            typ, amount = 'CR', credit
-
-        return {
-            'date':      date,
-            'desc':      desc,
-            'amount':    round(amount, 2),
-            'balance':   round(balance, 2) if balance is not None else None,
-            'type':      typ,
-            'reference': reference,
-        }
-
-    def _get_continuation(self, row, ignored):
-        for ci, c in enumerate(row):
-            if ci not in ignored:
-                if try_date(str(c)) or parse_amt(str(c)) > 0:
-                    return ''
-        text = ' '.join(str(c).strip() for ci, c in enumerate(row)
-                        if ci not in ignored and str(c).strip())
-        if len(text) < 3 or len(text) > 150 or self._should_skip_row([text]):
+            desc = _RE_VALUE_DATE.sub('', desc)
+            desc = _RE_CHQ_SUFFIX.sub('', desc)
+            desc = _RE_WHITESPACE.sub(' ', desc).strip()[:200]
+
+            reference = cell(row, ref_i) if ref_i is not None else ''
+
+            debit, credit = amounts(row, cells)
+            if debit == 0 and credit == 0:
+                return None
+
+            balance = None
+            if bal_i is not None:
+                b = parse_amt(cell(row, bal_i))
+                if b > 0:
+                    balance = b
+
+            if debit > 0:
+                typ, amount = 'DR', debit
+            else:
+                typ, amount = 'CR', credit
+
+            return {
+                'date':      date,
+                'desc':      desc,
+                'amount':    round(amount, 2),
+                'balance':   round(balance, 2) if balance is not None else None,
+                'type':      typ,
+                'reference': reference,
+            }
+
+        return parse_row
+
+    def _get_continuation(self, row, ignored, cells=None):
+        if cells is None:
+            cells = [str(c).strip() for c in row]
+        parts = []
+        for ci, s in enumerate(cells):
+            if ci in ignored or not s:
+                continue
+            if try_date(s) or parse_amt_stripped(s) > 0:
+                return ''
+            parts.append(s)
+        text = ' '.join(parts)
+        if len(text) < 3 or len(text) > 150 or self._should_skip_row([text.lower()]):
             return ''
         return text
 
-    @staticmethod
-    def _cell(row, idx):
-        if isinstance(idx, int) and 0 <= idx < len(row):
-            v = row[idx]
-            return str(v).strip() if v is not None else ''
-        return ''
+    def _classify_row(self, row, cells=None):
+        """One pass over a row → (stripped cells, per-cell tag) where tag is
+        'empty' / 'date' / 'num' / 'ref' / 'text'. cells may be passed in from
+        _prep_row."""
+        if cells is None:
+            cells = [str(c).strip() for c in row]
+        tags = []
+        for s in cells:
+            if not s:                       tags.append('empty')
+            elif try_date(s):               tags.append('date')
+            elif _is_num_cached(s):         tags.append('num')
+            elif _looks_like_ref_cached(s): tags.append('ref')
+            else:                           tags.append('text')
+        return cells, tags
 
     @staticmethod
-    def _is_num(text):
-        s = _RE_AMOUNT_JUNK.sub('', str(text).strip())
-        s = _RE_DR_CR_TAG.sub('', s).strip()
-        if not s:
-            return False
+    def _cell(row, idx):
         try:
-            float(s)
-            return True
-        except ValueError:
-            return False
-
-    @staticmethod
-    def _looks_like_ref(text):
-        t = str(text).strip()
-        if not t or len(t) < 6:
-            return False
-        if re.match(r'^[\d,. ]+$', t):
-            return False
-        return bool(re.match(r'^[A-Za-z0-9]{2,12}[-/]?\d{5,}$', t))
+            v = row[idx] if idx >= 0 else None
+        except (IndexError, TypeError):
+            return ''
+        if v is None:
+            return ''
+        return v.strip() if type(v) is str else str(v).strip()
 
     @staticmethod
     def _parse_amt_directed(text):
-        if not text:
+        s = str(text).strip() if text else ''
+        if not s:
             return 0.0, 0.0
-        amt   = parse_amt(text)
-        upper = str(text).strip().upper()
-        if '(' in text or str(text).strip().startswith('-') or upper.endswith('DR'):
+        amt = parse_amt_stripped(s)
+        tag = s[-2:].upper()
+        if '(' in s or s.startswith('-') or tag == 'DR':
             return amt, 0.0
-        if upper.endswith('CR'):
+        if tag == 'CR':
             return 0.0, amt
         return amt, 0.0
 
     @staticmethod
-    def _find_amts(row, col_map, ignored):
-        mapped = set(col_map.values()) | ignored
-        nums   = [parse_amt(str(c)) for ci, c in enumerate(row)
-                  if ci not in mapped and parse_amt(str(c)) > 0]
-        if not nums:       return 0.0, 0.0
-        if len(nums) == 1: return nums[0], 0.0
+    def _find_amts(cells, cols):
+        # cells: the row's stripped str cells (from _prep_row); cols: the
+        # indexes not owned by col_map or ignored — resolved once per row
+        # width by the caller, so no per-cell membership test
+        nums = []
+        for ci in cols:
+            s = cells[ci]
+            if not s:
+                continue
+            v = parse_amt_stripped(s)
+            if v > 0:
+                nums.append(v)
+                if len(nums) == 2:      # only the first two are ever used
+                    break
+        nums.extend((0.0, 0.0))         # pad: missing amounts read as 0.0
         return nums[0], nums[1]
-    
\ No newline at end of file
@@ -53,12 +53,15 @@ class HDFCParser(BaseParser):
     _IFSC_PREFIX    = 'hdfc0'
     _COLUMN_SIGNALS = ['narration', 'closing balance']
 
+    def detect_from_text(self, text_low: str) -> bool:
+        return ('hdfc0' in text_low and 'narration' in text_low and
+                ('closing balance' in text_low or 'closingbalance' in text_low))
+
     def detect(self, pdf_path: str) -> bool:
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 text = (pdf.pages[0].extract_text() or '').lower()
-                return ('hdfc0' in text and 'narration' in text and
-                        ('closing balance' in text or 'closingbalance' in text))
+                return self.detect_from_text(text)
         except Exception:
             return False
 
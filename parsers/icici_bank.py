@@ -45,16 +45,19 @@ _SKIP_RE = re.compile(
 
 class ICICIBankParser(BaseParser):
 
+    def detect_from_text(self, text_low: str) -> bool:
+        has_icici = (
+            'icicibank.com' in text_low or
+            'khayaal aapka' in text_low
+        )
+        has_columns = 'deposits' in text_low and 'withdrawals' in text_low
+        return has_icici and has_columns
+
     def detect(self, pdf_path: str) -> bool:
         try:
             with pdfplumber.open(pdf_path) as pdf:
-                text = (pdf.pages[0].extract_text() or '').upper()
-                has_icici = (
-                    'ICICIBANK.COM' in text or
-                    'KHAYAAL AAPKA' in text
-                )
-                has_columns = 'DEPOSITS' in text and 'WITHDRAWALS' in text
-                return has_icici and has_columns
+                text = (pdf.pages[0].extract_text() or '').lower()
+                return self.detect_from_text(text)
         except Exception:
             return False
 
@@ -83,20 +83,22 @@ class SBIParser(BaseParser):
         'sbin0', 'sbi bank', 'sbchq', 'sbnchq',
     ]
 
+    def detect_from_text(self, text_low: str) -> bool:
+        has_ifsc = 'sbin' in text_low
+
+        has_columns = (
+            ('post date' in text_low and 'value date' in text_low and 'debit' in text_low and 'credit' in text_low)
+            or
+            ('txn date' in text_low and 'debit' in text_low and 'credit' in text_low)
+        )
+
+        return has_ifsc and has_columns
+
     def detect(self, pdf_path: str) -> bool:
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 text = (pdf.pages[0].extract_text() or '').lower()
-
-                has_ifsc = 'sbin' in text
-
-                has_columns = (
-                    ('post date' in text and 'value date' in text and 'debit' in text and 'credit' in text)
-                    or
-                    ('txn date' in text and 'debit' in text and 'credit' in text)
-                )
-
-                return has_ifsc and has_columns
+                return self.detect_from_text(text)
         except Exception:
             return False
 